@@ -10,39 +10,46 @@ function log_error() {
 }
 
 
-# Dump the Postgres database to a file
+# Dump the Postgres database to a directory, one file per table
 # Args:
 #   $1 - DATABASE_URL
-#   $2 - OUT_FILE
+#   $2 - OUT_DIR
+#   $3 - JOBS (parallel pg_dump workers)
 function dump_db() {
     local DATABASE_URL=$1
-    local OUT_FILE=$2
+    local OUT_DIR=$2
+    local JOBS=$3
 
     pg_dump \
-        --format=custom \
+        --format=directory \
+        --jobs="$JOBS" \
         --compress=9 \
         --no-owner \
         --no-privileges \
         --dbname="$DATABASE_URL" \
-        --file="$OUT_FILE"
+        --file="$OUT_DIR"
 }
 
 
-# Upload a file to Supabase Storage bucket
+# Upload a file or dump directory to Supabase Storage bucket
 # Args:
-#   $1 - SUPABASE_BUCKET
-#   $2 - OBJECT_PATH (path in the bucket)
-#   $3 - FILE_PATH (local file path)
+#   $1 - SUPABASE_STORAGE_URL
+#   $2 - SUPABASE_SERVICE_ROLE_KEY
+#   $3 - SUPABASE_BUCKET
+#   $4 - OBJECT_PATH (path in the bucket)
+#   $5 - FILE_PATH (local file or directory path)
+#   $6 - JOBS (concurrent uploads for a directory)
 function upload_to_supabase() {
     local SUPABASE_STORAGE_URL=$1
     local SUPABASE_SERVICE_ROLE_KEY=$2
     local SUPABASE_BUCKET=$3
     local OBJECT_PATH=$4
     local FILE_PATH=$5
+    local JOBS=$6
 
     local BACKUP_CLI="python3 utils/backup-cli/main.py"
 
-    SUPABASE_URL="$SUPABASE_STORAGE_URL" SUPABASE_KEY="$SUPABASE_SERVICE_ROLE_KEY" $BACKUP_CLI upload -b "$SUPABASE_BUCKET" -d "$OBJECT_PATH" -f "$FILE_PATH"
+    SUPABASE_URL="$SUPABASE_STORAGE_URL" SUPABASE_KEY="$SUPABASE_SERVICE_ROLE_KEY" $BACKUP_CLI upload -b "$SUPABASE_BUCKET" -d "$OBJECT_PATH" -f "$FILE_PATH" -j "$JOBS"
 }
 
 # Env vars required:
@@ -51,6 +58,9 @@ function upload_to_supabase() {
 #   SUPABASE_SERVICE_ROLE_KEY  Service Role key
 #   SUPABASE_BUCKET            Storage bucket name (e.g., db-backups)
 #   BACKUP_ENV                 Environment label (e.g., prod|staging|dev)
+# Optional:
+#   DUMP_JOBS                  Parallel pg_dump workers (default: number of CPUs)
+#   UPLOAD_JOBS                Concurrent file uploads (default: 8)
 
 for var in DATABASE_URL SUPABASE_STORAGE_URL SUPABASE_SERVICE_ROLE_KEY SUPABASE_BUCKET BACKUP_ENV; do
   if [[ -z "${!var:-}" ]]; then
@@ -69,23 +79,24 @@ done
 
 PROJECT_NAME=${PROJECT_NAME:-moneylens}
 TIMESTAMP=$(date -u +"%Y-%m-%dT%H-%M-%SZ")
-FILENAME="${PROJECT_NAME}-${BACKUP_ENV}-pgdump-${TIMESTAMP}.dump"
+DUMP_JOBS=${DUMP_JOBS:-$(nproc)}
+UPLOAD_JOBS=${UPLOAD_JOBS:-8}
+DUMPNAME="${PROJECT_NAME}-${BACKUP_ENV}-pgdump-${TIMESTAMP}"
 TMP_DIR=$(mktemp -d)
 trap 'rm -rf "$TMP_DIR"' EXIT
 
 log_info "starting backup"
 
-OUT_FILE="$TMP_DIR/$FILENAME"
-log_info "running pg_dump to $OUT_FILE"
+OUT_DIR="$TMP_DIR/$DUMPNAME"
+log_info "running pg_dump with $DUMP_JOBS jobs to $OUT_DIR"
 
-dump_db "$DATABASE_URL" "$OUT_FILE"
+dump_db "$DATABASE_URL" "$OUT_DIR" "$DUMP_JOBS"
 
-log_info "dump completed, file size: $(du -h "$OUT_FILE" | cut -f1)"
+log_info "dump completed, $(ls "$OUT_DIR" | wc -l) files, total size: $(du -sh "$OUT_DIR" | cut -f1)"
 
-log_info "uploading to Supabase Storage bucket: $SUPABASE_BUCKET"
-OBJECT_PATH="${BACKUP_ENV}/$FILENAME"
-FILE_PATH="$OUT_FILE"
-upload_to_supabase "$SUPABASE_STORAGE_URL" "$SUPABASE_SERVICE_ROLE_KEY" "$SUPABASE_BUCKET" "$OBJECT_PATH" "$FILE_PATH"
+log_info "uploading to Supabase Storage bucket: $SUPABASE_BUCKET with $UPLOAD_JOBS jobs"
+OBJECT_PATH="${BACKUP_ENV}/$DUMPNAME"
+upload_to_supabase "$SUPABASE_STORAGE_URL" "$SUPABASE_SERVICE_ROLE_KEY" "$SUPABASE_BUCKET" "$OBJECT_PATH" "$OUT_DIR" "$UPLOAD_JOBS"
 
 log_info "upload successful: $SUPABASE_BUCKET/$OBJECT_PATH"
 
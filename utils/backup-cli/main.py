@@ -2,9 +2,26 @@
 
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
 from supabase import create_client, Client
 import os
 import logging
+import re
+
+
+MANIFEST_NAME = "manifest.json"
+DUMP_TOC_NAME = "toc.dat"  # Written by pg_dump --format=directory
+# Dump directory names written by scripts/backup-db.sh
+DUMP_NAME_PATTERN = re.compile(r"-pgdump-\d{4}-\d{2}-\d{2}T\d{2}-\d{2}-\d{2}Z$")
+LIST_PAGE_SIZE = 100
+DELETE_BATCH_SIZE = 100
+PLACEHOLDER_ID = ""  # id of cache entries recorded by this tool's own uploads
+DEFAULT_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "moneylens", "backup-cli-listings.json"
+)
 
 
 def setup_logging(level=None):
@@ -30,23 +47,350 @@ def get_client() -> Client:
     return client
 
 
+def is_folder(obj: dict) -> bool:
+    # Storage reports folders as entries without an id.
+    return obj.get("id") is None
+
+
+def storage_timestamp() -> str:
+    """Current UTC time in the format Storage uses for updated_at."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+class ListingCache:
+    """
+    Local cache of storage listings, keyed by bucket and prefix.
+
+    Stored as JSON at BACKUP_CLI_CACHE (default ~/.cache/moneylens/). Entries
+    are revalidated by list_objects and kept up to date by this tool's own
+    uploads and deletes.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or os.getenv("BACKUP_CLI_CACHE", DEFAULT_CACHE_PATH)
+        self.listings = {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.listings = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    @staticmethod
+    def key(bucket: str, path: str) -> str:
+        return f"{bucket}:{path.strip('/')}"
+
+    def get(self, bucket: str, path: str):
+        return self.listings.get(self.key(bucket, path))
+
+    def put(self, bucket: str, path: str, objects: list[dict]):
+        self.listings[self.key(bucket, path)] = objects
+
+    def drop(self, bucket: str, path: str):
+        self.listings.pop(self.key(bucket, path), None)
+
+    def drop_tree(self, bucket: str, path: str):
+        """Forget the listing of path and of every prefix below it."""
+        key = self.key(bucket, path)
+        below = key if key.endswith(":") else f"{key}/"
+        self.listings = {
+            k: v
+            for k, v in self.listings.items()
+            if k != key and not k.startswith(below)
+        }
+
+    def add(self, bucket: str, path: str, obj: dict):
+        """Record an object created under path, if path's listing is cached."""
+        objects = self.get(bucket, path)
+        if objects is not None:
+            objects[:] = [o for o in objects if o["name"] != obj["name"]] + [obj]
+            objects.sort(key=lambda o: o["name"], reverse=True)
+
+    def remove(self, bucket: str, path: str, names: set[str]):
+        """Forget objects deleted from under path."""
+        objects = self.get(bucket, path)
+        if objects is not None:
+            objects[:] = [o for o in objects if o["name"] not in names]
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.listings, f)
+        os.replace(tmp_path, self.path)
+
+
+def object_signature(obj: dict) -> tuple:
+    metadata = obj.get("metadata") or {}
+    return (obj["name"], obj.get("id"), obj.get("updated_at"), metadata.get("eTag"))
+
+
+def list_objects(
+    client: Client, bucket: str, path: str, cache: ListingCache = None
+) -> list[dict]:
+    """
+    List every object under path, following pagination.
+
+    Objects are listed by name, newest backup name first. With a cached
+    listing, pages are fetched only until one matches the cache exactly (by
+    name, id, updated_at and eTag); the rest of the listing is taken from the
+    cache. New backups sort first, so a typical run fetches a single page.
+    Deletions made outside this tool are only noticed within the fetched
+    pages; use --refresh to force a full relist.
+    """
+
+    logger = logging.getLogger(__name__)
+    cached = cache.get(bucket, path) if cache is not None else None
+    known = {object_signature(obj) for obj in cached} if cached else set()
+
+    objects = []
+    offset = 0
+    while True:
+        page = client.storage.from_(bucket).list(
+            path=path,
+            options={
+                "limit": LIST_PAGE_SIZE,
+                "offset": offset,
+                "sortBy": {"column": "name", "order": "desc"},
+            },
+        )
+        objects.extend(page)
+        if len(page) < LIST_PAGE_SIZE:
+            break
+        if known and all(object_signature(obj) in known for obj in page):
+            last_name = page[-1]["name"]
+            objects.extend(obj for obj in cached if obj["name"] < last_name)
+            logger.info(f"Reused cached listing of {bucket}/{path} after {offset} objects")
+            break
+        offset += LIST_PAGE_SIZE
+
+    if cache is not None:
+        cache.put(bucket, path, objects)
+    return objects
+
+
+def manifest_exists(client: Client, bucket: str, folder: str) -> bool:
+    """Check with one small search request that folder still holds a manifest."""
+    matches = client.storage.from_(bucket).list(
+        path=folder, options={"search": MANIFEST_NAME, "limit": 1}
+    )
+    return any(obj["name"] == MANIFEST_NAME for obj in matches)
+
+
+def list_backups(
+    client: Client, bucket: str, path: str, cache: ListingCache = None
+) -> list[dict]:
+    """
+    List backups under path, treating each directory-format dump as one unit.
+
+    Returns dicts with "name", "updated_at", "paths" (every object path that
+    belongs to the backup) and "complete". A directory backup is dated by its
+    manifest, which is uploaded last; one without a manifest is an incomplete
+    upload and is dated by its newest file so that it still ages out. A folder counts as a backup if it
+    holds a manifest or a pg_dump table of contents, or if its name matches the
+    dump naming pattern (an upload that died before toc.dat); other folders
+    are skipped. Completed directory backups never change, so their cached
+    listings are reused once they hold Storage's own metadata rather than the
+    placeholders recorded at upload time, after a single search confirms the
+    manifest has not been deleted behind the cache's back.
+    """
+
+    backups = []
+    for obj in list_objects(client, bucket, path, cache):
+        if not is_folder(obj):
+            backups.append(
+                {
+                    "name": obj["name"],
+                    "updated_at": obj["updated_at"],
+                    "paths": [os.path.join(path, obj["name"])],
+                    "complete": True,
+                }
+            )
+            continue
+
+        folder = os.path.join(path, obj["name"])
+        files = cache.get(bucket, folder) if cache is not None else None
+        if (
+            not files
+            or not any(f["name"] == MANIFEST_NAME for f in files)
+            or any(f.get("id") == PLACEHOLDER_ID for f in files)
+            or not manifest_exists(client, bucket, folder)
+        ):
+            files = list_objects(client, bucket, folder, cache)
+        files = [f for f in files if not is_folder(f)]
+        names = {f["name"] for f in files}
+        if not files or (
+            MANIFEST_NAME not in names
+            and DUMP_TOC_NAME not in names
+            and not DUMP_NAME_PATTERN.search(obj["name"])
+        ):
+            continue
+        manifest = next((f for f in files if f["name"] == MANIFEST_NAME), None)
+        backups.append(
+            {
+                "name": obj["name"] + "/",
+                "updated_at": (
+                    manifest["updated_at"]
+                    if manifest
+                    else max(f["updated_at"] for f in files)
+                ),
+                "paths": [os.path.join(folder, f["name"]) for f in files],
+                "complete": manifest is not None,
+            }
+        )
+    return backups
+
+
+def get_cache(args) -> ListingCache:
+    cache = ListingCache()
+    if getattr(args, "refresh", False):
+        cache.drop_tree(args.bucket, args.path or "")
+    return cache
+
+
 def list_files(args):
     client = get_client()
-    objects = client.storage.from_(args.bucket).list(path=args.path or "")
-    for obj in objects:
-        print(obj["name"])
+    cache = get_cache(args)
+    for backup in list_backups(client, args.bucket, args.path or "", cache):
+        print(backup["name"])
+    cache.save()
+
+
+def file_sha256(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def upload_directory(
+    client: Client,
+    bucket: str,
+    directory: str,
+    dest: str,
+    jobs: int,
+    cache: ListingCache,
+):
+    """
+    Upload every file in directory (e.g. pg_dump --format=directory output)
+    concurrently, then upload a manifest listing them.
+
+    All uploads share one client and therefore one HTTP connection pool. The
+    manifest is written last, so its presence marks the backup as complete.
+    """
+
+    logger = logging.getLogger(__name__)
+    storage = client.storage.from_(bucket)
+
+    rel_paths = sorted(
+        os.path.relpath(os.path.join(root, name), directory)
+        for root, _, names in os.walk(directory)
+        for name in names
+    )
+
+    def upload_one(rel_path: str) -> dict:
+        local_path = os.path.join(directory, rel_path)
+        entry = {
+            "path": rel_path,
+            "size": os.path.getsize(local_path),
+            "sha256": file_sha256(local_path),
+        }
+        with open(local_path, "rb") as f:
+            storage.upload(file=f, path=f"{dest}/{rel_path}")
+        logger.info(f"Uploaded {dest}/{rel_path}")
+        return entry
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        entries = list(executor.map(upload_one, rel_paths))
+
+    manifest = {
+        "format": "directory",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "files": entries,
+    }
+    storage.upload(
+        file=json.dumps(manifest, indent=2).encode("utf-8"),
+        path=f"{dest}/{MANIFEST_NAME}",
+        file_options={"content-type": "application/json"},
+    )
+    print(f"Uploaded {len(entries)} files and manifest to {bucket}/{dest}")
+
+    # Placeholder entries: list_backups relists a folder holding any of them
+    # once, replacing them with Storage's own metadata.
+    updated_at = storage_timestamp()
+    cache.put(
+        bucket,
+        dest,
+        [
+            {"name": name, "id": PLACEHOLDER_ID, "updated_at": updated_at}
+            for name in sorted(
+                [entry["path"] for entry in entries] + [MANIFEST_NAME], reverse=True
+            )
+        ],
+    )
+    cache.add(
+        bucket,
+        os.path.dirname(dest),
+        {"name": os.path.basename(dest), "id": None, "updated_at": None},
+    )
 
 
 def upload_file(args):
     client = get_client()
+    cache = get_cache(args)
+    if os.path.isdir(args.file):
+        upload_directory(
+            client, args.bucket, args.file, args.dest.rstrip("/"), args.jobs, cache
+        )
+        cache.save()
+        return
+
     with open(args.file, "rb") as f:
         response = client.storage.from_(args.bucket).upload(file=f, path=args.dest)
     print(f"Uploaded to {response.full_path}")
 
+    cache.add(
+        args.bucket,
+        os.path.dirname(args.dest),
+        {
+            "name": os.path.basename(args.dest),
+            "id": PLACEHOLDER_ID,
+            "updated_at": storage_timestamp(),
+        },
+    )
+    cache.save()
+
+
+def delete_backup(storage, backup: dict) -> list[dict]:
+    """
+    Delete every object of a backup.
+
+    The manifest is deleted in its own request first, so an interrupted prune
+    never leaves a backup that looks complete. The remaining objects are
+    deleted in batches of DELETE_BATCH_SIZE.
+    """
+
+    paths = backup["paths"]
+    manifests = [p for p in paths if os.path.basename(p) == MANIFEST_NAME]
+    others = [p for p in paths if os.path.basename(p) != MANIFEST_NAME]
+
+    batches = [manifests] if manifests else []
+    batches.extend(
+        others[i : i + DELETE_BATCH_SIZE]
+        for i in range(0, len(others), DELETE_BATCH_SIZE)
+    )
+
+    deleted = []
+    for batch in batches:
+        deleted.extend(storage.remove(batch))
+    return deleted
+
 
 def prune_files(args):
     client = get_client()
-    objects = client.storage.from_(args.bucket).list(path=args.path or "")
+    cache = get_cache(args)
+    objects = list_backups(client, args.bucket, args.path or "", cache)
+    cache.save()
 
     # Sort files by updated_at descending
     objects.sort(key=lambda x: x["updated_at"], reverse=True)
@@ -54,8 +398,6 @@ def prune_files(args):
     to_delete = []
 
     if args.days:
-        from datetime import datetime, timedelta
-
         cutoff_date = datetime.now() - timedelta(days=args.days)
         for obj in objects:
             obj_date = datetime.strptime(obj["updated_at"], "%Y-%m-%dT%H:%M:%S.%fZ")
@@ -63,13 +405,16 @@ def prune_files(args):
                 to_delete.append(obj)
 
     if args.keep:
-        to_delete.extend(objects[args.keep :])
+        # Incomplete uploads must not displace real backups from the kept set;
+        # they are removed by age alone.
+        complete = [obj for obj in objects if obj["complete"]]
+        to_delete.extend(complete[args.keep :])
 
     to_delete = list(
         {obj["name"]: obj for obj in to_delete}.values()
     )  # Remove duplicates
 
-    paths_to_delete = [os.path.join(args.path or "", obj["name"]) for obj in to_delete]
+    paths_to_delete = [path for obj in to_delete for path in obj["paths"]]
 
     if not paths_to_delete:
         print("No files to delete.")
@@ -81,9 +426,17 @@ def prune_files(args):
             print(path)
 
     else:
-        response = client.storage.from_(args.bucket).remove(paths_to_delete)
-        for obj in response:
-            print(f"Deleted {obj['name']}")
+        storage = client.storage.from_(args.bucket)
+        for obj in to_delete:
+            # Forget the backup before deleting it, so an interrupted delete
+            # leaves no cached listing that claims the backup is still complete.
+            if obj["name"].endswith("/"):
+                cache.drop(args.bucket, os.path.join(args.path or "", obj["name"]))
+            cache.remove(args.bucket, args.path or "", {obj["name"].rstrip("/")})
+            cache.save()
+
+            for deleted in delete_backup(storage, obj):
+                print(f"Deleted {deleted['name']}")
 
 
 def build_parser():
@@ -98,14 +451,30 @@ def build_parser():
     list_parser = subparsers.add_parser("list", help="List files in a bucket")
     list_parser.add_argument("-b", "--bucket", required=True, help="Bucket name")
     list_parser.add_argument("-p", "--path", help="Path within the bucket")
+    list_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the local listing cache and relist everything",
+    )
     list_parser.set_defaults(func=list_files)
 
-    upload_parser = subparsers.add_parser("upload", help="Upload a file to a bucket")
+    upload_parser = subparsers.add_parser(
+        "upload", help="Upload a file or dump directory to a bucket"
+    )
     upload_parser.add_argument("-b", "--bucket", required=True, help="Bucket name")
-    upload_parser.add_argument("-f", "--file", required=True, help="Local file path")
+    upload_parser.add_argument(
+        "-f", "--file", required=True, help="Local file or directory path"
+    )
     upload_parser.add_argument(
         "-d", "--dest", required=True, help="Destination path in bucket"
     )
+    upload_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        help="Concurrent uploads when --file is a directory",
+    )
     upload_parser.set_defaults(func=upload_file)
 
     prune_parser = subparsers.add_parser("prune", help="Prune old files in a bucket")
@@ -126,6 +495,11 @@ def build_parser():
         action="store_true",
         help="Show files to be deleted without deleting",
     )
+    prune_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore the local listing cache and relist everything",
+    )
 
     prune_parser.set_defaults(func=prune_files)
 
@@ -1,9 +1,19 @@
 import argparse
 import csv
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
+from datetime import datetime
+from functools import lru_cache
+import gc
+import io
 import json
-from typing import Optional, TextIO
+import mmap
+import os
+import re
+import sys
+from typing import Iterable, Optional, TextIO
 
 
 @dataclass
@@ -211,6 +221,22 @@ class PayloadBuilder:
         self.transactions.append(transaction)
         return self
 
+    def add_transactions(self, transactions: Iterable[Transaction]) -> "PayloadBuilder":
+        """
+        Add multiple transactions to the payload.
+
+        Transactions are always added without duplication checking.
+
+        Args:
+            transactions (Iterable[Transaction]): The transaction objects to add.
+
+        Returns:
+            PayloadBuilder: Returns self to allow method chaining.
+        """
+
+        self.transactions.extend(transactions)
+        return self
+
     def build(self) -> Payload:
         """
         Build and return the final Payload object.
@@ -230,14 +256,152 @@ class PayloadBuilder:
         )
 
 
+DEFAULT_BANK_ACCOUNT_CODES = {
+    "": "NatWest",
+    "B": "Barclays",
+    "W": "Wise Virtual Card",
+    "X": "AmEx",
+    "M": "Monzo",
+    "A": "Wise Virtual Card",
+}
+
+DEFAULT_DATE_FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%d/%m/%y", "%d %b %Y", "%d-%b-%Y"]
+
+
+class Normalizer:
+    """
+    Normalises field values shared across rows, loaded once per run.
+
+    Sheet exports repeat a few dozen distinct categories, tags, types, bank
+    codes and dates across thousands of rows. The normalizer interns those
+    strings, parses each distinct date and tag cell only once (bounded memo
+    caches) and hands out a single shared Category or BankAccount instance
+    per distinct value.
+
+    Attributes:
+        bank_account_codes (dict[str, str]): Mapping of sheet bank codes to
+            bank account names.
+        date_formats (list[str]): strptime formats tried in order when parsing dates.
+        cache_size (int): Maximum entries kept by the date and tag memo caches.
+
+    Example:
+        >>> normalizer = Normalizer()
+        >>> normalizer.parse_date("05/03/2025")
+        '2025-03-05'
+        >>> normalizer.bank_account("B") is normalizer.bank_account("B")
+        True
+    """
+
+    def __init__(
+        self,
+        bank_account_codes: Optional[dict[str, str]] = None,
+        date_formats: Optional[list[str]] = None,
+        cache_size: int = 4096,
+    ):
+        self.bank_account_codes = dict(bank_account_codes or DEFAULT_BANK_ACCOUNT_CODES)
+        self.date_formats = list(date_formats or DEFAULT_DATE_FORMATS)
+        self.cache_size = cache_size
+        self._init_caches()
+
+    def _init_caches(self):
+        self._categories = {}
+        self._bank_accounts = {}
+        self._tags = {}
+        self.parse_date = lru_cache(maxsize=self.cache_size)(self._parse_date)
+        self.parse_tags = lru_cache(maxsize=self.cache_size)(self._parse_tags)
+
+    def __getstate__(self):
+        # Caches are rebuilt on unpickling, e.g. in convert_mmap worker processes.
+        return {
+            "bank_account_codes": self.bank_account_codes,
+            "date_formats": self.date_formats,
+            "cache_size": self.cache_size,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_caches()
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs) -> "Normalizer":
+        """
+        Create a normalizer with the bank account code mapping read from a JSON
+        file of the form {"<code>": "<bank account name>", ...}.
+        """
+
+        with open(path, mode="r", encoding="utf-8") as f:
+            return cls(bank_account_codes=json.load(f), **kwargs)
+
+    def intern(self, value: str) -> str:
+        """Return the canonical instance of a string value."""
+        return sys.intern(value)
+
+    def _parse_date(self, value: str) -> str:
+        """
+        Parse a sheet date into ISO format (YYYY-MM-DD).
+
+        Raises:
+            ValueError: If value matches none of the configured date formats.
+        """
+
+        for date_format in self.date_formats:
+            try:
+                return self.intern(
+                    datetime.strptime(value, date_format).date().isoformat()
+                )
+            except ValueError:
+                continue
+        raise ValueError(f"Invalid date format: {value}")
+
+    def _parse_tags(self, value: str) -> Optional[tuple[str, ...]]:
+        # A tuple, since the cached result is shared between rows with the same
+        # tags cell; callers copy it into each Transaction.
+        tags = parse_transaction_tags(value)
+        return tuple(self.intern(tag) for tag in tags) if tags else None
+
+    def category(self, type: str, name: str) -> Category:
+        """Return the shared Category for (type, name)."""
+        key = (type, name)
+        category = self._categories.get(key)
+        if category is None:
+            category = Category(
+                type=self.intern(type), name=self.intern(name), description=None
+            )
+            self._categories[key] = category
+        return category
+
+    def bank_account(self, code: str) -> BankAccount:
+        """
+        Return the shared BankAccount for a sheet bank code.
+
+        Raises:
+            ValueError: If the code is not in bank_account_codes.
+        """
+
+        name = self.bank_account_codes.get(code)
+        if not name:
+            raise ValueError(f"Unknown bank account code: {code}")
+        return self.named_bank_account(name)
+
+    def named_bank_account(self, name: str) -> BankAccount:
+        """Return the shared BankAccount with the given name."""
+        account = self._bank_accounts.get(name)
+        if account is None:
+            account = BankAccount(name=self.intern(name), description=None)
+            self._bank_accounts[name] = account
+        return account
+
+
 class BaseConverter(ABC):
     """
-    Base class for CSV converters providing a shared payload builder
-    and a common interface for converting files and retrieving payloads.
+    Base class for CSV converters providing a shared payload builder,
+    a value normalizer and a common interface for converting files and
+    retrieving payloads.
     """
 
-    def __init__(self):
+    def __init__(self, normalizer: Optional[Normalizer] = None):
         self.payload_builder = PayloadBuilder()
+        self.normalizer = normalizer or Normalizer()
 
     @abstractmethod
     def convert(self, csv_file: TextIO):
@@ -248,6 +412,198 @@ class BaseConverter(ABC):
         return self.payload_builder.build()
 
 
+SAVINGS_FIELDNAMES = ["skip1", "skip2", "date", "amount", "category", "notes"]
+SAVINGS_HEADER_ROWS = 2  # Savings CSV has 2 header rows to skip
+
+LINE_ENDING_SAMPLE = 1024 * 1024  # Bytes inspected to detect bare "\r" line endings
+
+# A quote opens a quoted field only at the start of a field, as in the csv
+# module; anywhere else (e.g. 12" pipe) it is a literal character. Possessive
+# quantifiers keep the scans from backtracking.
+CSV_QUOTED_FIELD = re.compile(rb'"(?:[^"]++|"")*+(?:"|\Z)')
+# Consumes complete fields and stops at a quoted field left open by endpos.
+CSV_CLOSED_TOKENS = re.compile(
+    rb'(?:[^"]++|(?<![^,\r\n])"(?:[^"]++|"")*+"|(?<=[^,\r\n])")*+'
+)
+
+
+def open_quoted_field(buffer: mmap.mmap, start: int, end: int) -> Optional[int]:
+    """
+    Find the quoted field, if any, that is still open at the end of a range.
+
+    Args:
+        buffer (mmap.mmap): The memory-mapped file.
+        start (int): Offset outside any quoted field (e.g. a record boundary).
+        end (int): End of the range (exclusive). Must not split an escaped quote.
+
+    Returns:
+        Optional[int]: Offset of the opening quote of the field that spans end,
+            or None if end lies outside quoted fields.
+    """
+
+    stop = CSV_CLOSED_TOKENS.match(buffer, start, end).end()
+    return stop if stop < end else None
+
+
+def next_record_start(buffer: mmap.mmap, start: int, pos: int) -> int:
+    """
+    Find the offset of the first record that starts after pos.
+
+    Quotes are interpreted the way the csv module reads them, so newlines
+    inside quoted fields are skipped while literal quotes in unquoted fields
+    (e.g. 12" pipe) and escaped quotes ("") do not confuse the scan.
+
+    Args:
+        buffer (mmap.mmap): The memory-mapped file.
+        start (int): A record boundary at or before pos, where the scan for
+            quoted fields begins.
+        pos (int): Offset to start searching for a newline from.
+
+    Returns:
+        int: Offset just past the newline terminating the record that contains
+            pos, or the buffer size if that record runs to the end of the file.
+    """
+
+    size = len(buffer)
+    while pos < size:
+        newline = buffer.find(b"\n", pos)
+        if newline == -1:
+            return size
+        field_start = open_quoted_field(buffer, start, newline + 1)
+        if field_start is None:
+            return newline + 1
+        # The newline is quoted; resume the scan once the field closes.
+        start = pos = CSV_QUOTED_FIELD.match(buffer, field_start).end()
+    return size
+
+
+@contextmanager
+def gc_paused():
+    """
+    Pause the cyclic garbage collector while building many acyclic objects.
+
+    Parsing or merging millions of rows otherwise triggers repeated full
+    collections that traverse every row created so far.
+    """
+
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def skip_csv_records(buffer: mmap.mmap, count: int) -> int:
+    """
+    Find the byte offset just past the first count records of a CSV buffer.
+
+    Records are read with the csv module, one line at a time, so quoted
+    newlines are handled and blank rows are not counted, matching how
+    csv.DictReader skips them.
+
+    Args:
+        buffer (mmap.mmap): The memory-mapped file.
+        count (int): Number of records to skip.
+
+    Returns:
+        int: Offset of the first byte after the skipped records, or the buffer
+            size if the file has no more records.
+    """
+
+    size = len(buffer)
+    offset = 0
+
+    def lines():
+        nonlocal offset
+        while offset < size:
+            newline = buffer.find(b"\n", offset)
+            end = size if newline == -1 else newline + 1
+            line = buffer[offset:end].decode("utf-8")
+            offset = end
+            yield line
+
+    if count <= 0:
+        return 0
+
+    skipped = 0
+    # csv.reader pulls only the lines it needs for each record, so offset is
+    # exactly the end of the last record returned.
+    for row in csv.reader(lines()):
+        if row:
+            skipped += 1
+        if skipped == count:
+            return offset
+    return size
+
+
+def check_line_endings(buffer: mmap.mmap):
+    """
+    Reject files that use bare "\r" line endings.
+
+    Records are split on "\n", so "\n" and "\r\n" files are supported, but a
+    file using only "\r" (which convert() reads through universal newlines)
+    would otherwise be seen as a single record.
+
+    Raises:
+        ValueError: If the start of the file contains a "\r" that is not
+            followed by "\n".
+    """
+
+    sample = buffer[:LINE_ENDING_SAMPLE]
+    if sample.endswith(b"\r"):
+        sample = sample[:-1]
+    if sample.count(b"\r") != sample.count(b"\r\n"):
+        raise ValueError(
+            "Files with bare \\r line endings are not supported in parallel mode; "
+            "convert them without --jobs"
+        )
+
+
+def split_csv_ranges(
+    csv_path: str, parts: int, skip_records: int = 0
+) -> list[tuple[int, int]]:
+    """
+    Split a CSV file into byte ranges that each start and end on a record boundary.
+
+    Args:
+        csv_path (str): Path to the CSV file.
+        parts (int): Desired number of ranges. Fewer are returned for small files.
+        skip_records (int): Number of leading records (e.g. headers) to exclude.
+
+    Returns:
+        list[tuple[int, int]]: (start, end) byte offsets in file order. Empty if
+            the file has no records after the skipped ones.
+
+    Raises:
+        ValueError: If the file uses bare "\r" line endings.
+    """
+
+    with open(csv_path, mode="rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            check_line_endings(buffer)
+            size = len(buffer)
+            data_start = skip_csv_records(buffer, skip_records)
+            if data_start >= size:
+                return []
+
+            chunk_size = max(1, (size - data_start) // max(1, parts))
+            ranges = []
+            start = data_start
+            while start < size:
+                candidate = start + chunk_size
+                if candidate >= size or len(ranges) == parts - 1:
+                    ranges.append((start, size))
+                    break
+                end = next_record_start(buffer, start, candidate)
+                ranges.append((start, end))
+                start = end
+            return ranges
+
+
 class SavingsConverter(BaseConverter):
     """
     Converter for transforming savings account CSV files into JSON format.
@@ -267,10 +623,14 @@ class SavingsConverter(BaseConverter):
         >>> payload = converter.get_payload()
     """
 
-    def __init__(self, bank_account_name: str = "Savings Account"):
-        super().__init__()
+    def __init__(
+        self,
+        bank_account_name: str = "Savings Account",
+        normalizer: Optional[Normalizer] = None,
+    ):
+        super().__init__(normalizer)
         self.transaction_type = "save"
-        self.bank_account = BankAccount(bank_account_name, None)
+        self.bank_account = self.normalizer.named_bank_account(bank_account_name)
 
     def convert(self, csv_file: TextIO):
         """
@@ -296,20 +656,130 @@ class SavingsConverter(BaseConverter):
             - The CSV file is expected to have 2 header rows that are skipped during processing.
             - Only rows with non-empty category_name, date, and amount are processed.
             - The amount is parsed using the parse_amount utility function.
+            - Dates are converted to ISO format and categories shared via self.normalizer.
             - All string fields are stripped of leading/trailing whitespace.
         """
 
-        fieldnames = ["skip1", "skip2", "date", "amount", "category", "notes"]
-        reader = csv.DictReader(csv_file, fieldnames=fieldnames)
+        reader = csv.DictReader(csv_file, fieldnames=SAVINGS_FIELDNAMES)
 
-        skip_rows = 2  # Savings CSV has 2 header rows to skip
-        for _ in range(skip_rows):
+        for _ in range(SAVINGS_HEADER_ROWS):
             try:
                 next(reader)
             except StopIteration:
                 # File shorter than expected header rows; nothing to convert.
                 return
 
+        self._convert_rows(reader)
+
+    def convert_mmap(self, csv_path: str, jobs: Optional[int] = None):
+        """
+        Convert a savings CSV file in parallel using memory-mapped byte ranges.
+
+        The file is memory-mapped and, after the header rows, split into byte ranges
+        that end on record boundaries (newlines inside quoted fields are respected).
+        Each range is parsed by a separate worker process, which sends back plain
+        row tuples and its distinct category names rather than dataclasses, so the
+        results are cheap to transfer. They are added to self.payload_builder in
+        file order, producing the same payload as convert().
+
+        Args:
+            csv_path (str): Path to the savings CSV file.
+            jobs (Optional[int]): Number of worker processes. Defaults to the number
+                of CPUs.
+
+        Returns:
+            None: This method modifies the payload_builder in place and does not return a value.
+
+        Raises:
+            ValueError: If the file uses bare "\r" line endings.
+        """
+
+        jobs = jobs or os.cpu_count() or 1
+        ranges = split_csv_ranges(csv_path, jobs, skip_records=SAVINGS_HEADER_ROWS)
+        if not ranges:
+            return
+
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            category_names, rows = _parse_savings_range(
+                csv_path, start, end, self.normalizer
+            )
+            with gc_paused():
+                self._add_rows(category_names, rows)
+            return
+
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            results = executor.map(
+                _parse_savings_range,
+                [csv_path] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges],
+                [self.normalizer] * len(ranges),
+            )
+            with gc_paused():
+                for category_names, rows in results:
+                    self._add_rows(category_names, rows)
+
+    def _add_rows(self, category_names: list[str], rows: list[tuple]):
+        """
+        Add rows produced by _parse_rows to the payload builder.
+
+        Args:
+            category_names (list[str]): Distinct category names of rows, in order
+                of first appearance.
+            rows (list[tuple]): (date, category, amount, notes) tuples.
+        """
+
+        for category_name in category_names:
+            self.payload_builder.add_category(
+                self.normalizer.category(self.transaction_type, category_name)
+            )
+        if rows:
+            self.payload_builder.add_bank_account(self.bank_account)
+
+        transaction_type = self.transaction_type
+        bank_account_name = self.bank_account.name
+        self.payload_builder.add_transactions(
+            Transaction(
+                date, transaction_type, category, bank_account_name, amount, None, notes
+            )
+            for date, category, amount, notes in rows
+        )
+
+    def _convert_rows(self, reader: csv.DictReader):
+        """
+        Add a transaction to the payload builder for every data row in reader.
+
+        Args:
+            reader (csv.DictReader): Reader positioned after any header rows.
+        """
+
+        for date, category_name, amount, notes in self._parse_rows(reader):
+            category = self.normalizer.category(self.transaction_type, category_name)
+            self.payload_builder.add_category(
+                category,
+            ).add_bank_account(
+                self.bank_account,
+            ).add_transaction(
+                Transaction(
+                    date=date,
+                    amount=amount,
+                    notes=notes,
+                    category=category.name,
+                    bank_account=self.bank_account.name,
+                    tags=None,
+                    type=self.transaction_type,
+                ),
+            )
+
+    def _parse_rows(self, reader: csv.DictReader):
+        """
+        Yield (date, category, amount, notes) for every valid data row in reader.
+
+        Args:
+            reader (csv.DictReader): Reader positioned after any header rows.
+        """
+
         for row in reader:
             category_name = row.get("category", "").strip()
             date = row.get("date", "").strip()
@@ -320,64 +790,47 @@ class SavingsConverter(BaseConverter):
             if not category_name:
                 category_name = "Savings"
             if category_name and date:
-                self.payload_builder.add_category(
-                    Category(
-                        type=self.transaction_type,
-                        name=category_name,
-                        description=None,
-                    ),
-                ).add_bank_account(
-                    self.bank_account,
-                ).add_transaction(
-                    Transaction(
-                        date=date,
-                        amount=amount,
-                        notes=notes,
-                        category=category_name,
-                        bank_account=self.bank_account.name,
-                        tags=None,
-                        type=self.transaction_type,
-                    ),
+                yield (
+                    self.normalizer.parse_date(date),
+                    self.normalizer.intern(category_name),
+                    amount,
+                    notes,
                 )
 
     # Inherit get_payload from BaseConverter
 
 
-def parse_transaction_bank_account(code: str) -> BankAccount:
+def _parse_savings_range(
+    csv_path: str,
+    start: int,
+    end: int,
+    normalizer: Normalizer,
+) -> tuple[list[str], list[tuple]]:
     """
-    Parse a bank account code and return the corresponding BankAccount object.
+    Parse the savings records in csv_path[start:end] into plain row tuples.
 
-    Args:
-        code (str): A single character code representing a bank account.
-                    Valid codes are:
-                    - "" (empty string): NatWest
-                    - "B": Barclays
-                    - "W": Wise Virtual Card
-                    - "X": AmEx
-                    - "M": Monzo
-                    - "A": Wise Virtual Card
+    Used as the worker for SavingsConverter.convert_mmap. Only the given byte
+    range is decoded, so each worker holds just its own share of the file.
 
     Returns:
-        BankAccount: A BankAccount object with the corresponding bank name and None as description.
-
-    Raises:
-        ValueError: If the provided code is not found in the mapping.
+        tuple[list[str], list[tuple]]: Distinct category names in order of first
+            appearance, and (date, category, amount, notes) tuples.
     """
 
-    mapping = {
-        "": "NatWest",
-        "B": "Barclays",
-        "W": "Wise Virtual Card",
-        "X": "AmEx",
-        "M": "Monzo",
-        "A": "Wise Virtual Card",
-    }
+    with open(csv_path, mode="rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            text = buffer[start:end].decode("utf-8")
 
-    bank_account_name = mapping.get(code)
-    if not bank_account_name:
-        raise ValueError(f"Unknown bank account code: {code}")
-
-    return BankAccount(name=bank_account_name, description=None)
+    converter = SavingsConverter(normalizer=normalizer)
+    with gc_paused():
+        rows = list(
+            converter._parse_rows(
+                csv.DictReader(
+                    io.StringIO(text, newline=None), fieldnames=SAVINGS_FIELDNAMES
+                )
+            )
+        )
+    return list(dict.fromkeys(row[1] for row in rows)), rows
 
 
 def parse_transaction_tags(tags: str) -> Optional[list[str]]:
@@ -433,8 +886,8 @@ class TransactionConverter(BaseConverter):
         ...     converter.convert(f)
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, normalizer: Optional[Normalizer] = None):
+        super().__init__(normalizer)
 
     def convert(self, csv_file: TextIO):
         """
@@ -466,6 +919,7 @@ class TransactionConverter(BaseConverter):
             - Rows 2-13 contain spending transactions
             - Rows 14+ contain earning transactions
             - All earning transactions use "Barclays" as the default bank account
+            - Dates, categories, bank accounts and tags go through self.normalizer
             - Empty rows (missing date, category, or amount) are skipped
         """
 
@@ -487,39 +941,38 @@ class TransactionConverter(BaseConverter):
         earn_date_row = 1
         spend_transactions_start_row = 2
         earn_transactions_start_row = 14  # Earnings records start
-        earn_bank_account = "Barclays"
+        normalizer = self.normalizer
+        earn_bank_account = normalizer.named_bank_account("Barclays")
 
         earn_date = None
         for idx, row in enumerate(reader):
             if idx == earn_date_row:
                 earn_date = row.get("earn_date", "").strip()
+                earn_date = normalizer.parse_date(earn_date) if earn_date else earn_date
             if idx >= spend_transactions_start_row:
                 spend_date = row.get("date", "").strip()
                 spend_category = row.get("category", "").strip()
                 spend_amount = row.get("amount", "").strip()
-                spend_tags = parse_transaction_tags(row.get("tags", "").strip())
+                spend_tags = normalizer.parse_tags(row.get("tags", "").strip())
                 if spend_date and spend_category and spend_amount:
-                    spend_bank_account = parse_transaction_bank_account(
+                    spend_bank_account = normalizer.bank_account(
                         row.get("bank_account", "").strip()
                     )
+                    category = normalizer.category("spend", spend_category)
                     self.payload_builder.add_category(
-                        Category(
-                            type="spend",
-                            name=spend_category,
-                            description=None,
-                        ),
+                        category,
                     ).add_bank_account(
                         spend_bank_account,
                     ).add_tags(
                         spend_tags if spend_tags else []
                     ).add_transaction(
                         Transaction(
-                            date=spend_date,
-                            type="spend",
-                            category=spend_category,
+                            date=normalizer.parse_date(spend_date),
+                            type=category.type,
+                            category=category.name,
                             bank_account=spend_bank_account.name,
                             amount=parse_amount(spend_amount),
-                            tags=spend_tags,
+                            tags=list(spend_tags) if spend_tags else None,
                             notes=None,
                         ),
                     )
@@ -529,23 +982,17 @@ class TransactionConverter(BaseConverter):
                 earn_amount = row.get("earn_amount", "").strip()
 
                 if earn_category and earn_amount:
+                    category = normalizer.category("earn", earn_category)
                     self.payload_builder.add_category(
-                        Category(
-                            type="earn",
-                            name=earn_category,
-                            description=None,
-                        ),
+                        category,
                     ).add_bank_account(
-                        BankAccount(
-                            name=earn_bank_account,
-                            description=None,
-                        ),
+                        earn_bank_account,
                     ).add_transaction(
                         Transaction(
                             date=earn_date,
-                            type="earn",
-                            category=earn_category,
-                            bank_account=earn_bank_account,
+                            type=category.type,
+                            category=category.name,
+                            bank_account=earn_bank_account.name,
                             amount=parse_amount(earn_amount),
                             tags=None,
                             notes=None,
@@ -580,6 +1027,22 @@ if __name__ == "__main__":
         help="Path(s) to input CSV file(s)",
     )
     parser.add_argument("-o", "--output", help="Path to the output JSON file")
+    parser.add_argument(
+        "--bank-codes",
+        help="Path to a JSON file mapping bank account codes to bank account names",
+    )
+    parser.add_argument(
+        "--date-format",
+        action="append",
+        help="strptime format for input dates, tried in order (repeatable)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes for savings CSVs (0 = number of CPUs)",
+    )
     parser.add_argument(
         "-t",
         "--type",
@@ -589,13 +1052,23 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    if args.type == "transactions":
-        converter = TransactionConverter()
-    else:
-        converter = SavingsConverter()
-
     try:
+        if args.bank_codes:
+            normalizer = Normalizer.from_file(
+                args.bank_codes, date_formats=args.date_format
+            )
+        else:
+            normalizer = Normalizer(date_formats=args.date_format)
+
+        if args.type == "transactions":
+            converter = TransactionConverter(normalizer)
+        else:
+            converter = SavingsConverter(normalizer=normalizer)
+
         for input_path in args.input:
+            if isinstance(converter, SavingsConverter) and args.jobs != 1:
+                converter.convert_mmap(input_path, args.jobs or None)
+                continue
             with open(input_path, mode="r", encoding="utf-8") as csv_file:
                 converter.convert(csv_file)
 
@@ -0,0 +1,65 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+MODULE_PATH = os.path.join(os.path.dirname(__file__), "csv-converter.py")
+
+spec = importlib.util.spec_from_file_location("csv_converter", MODULE_PATH)
+csv_converter = importlib.util.module_from_spec(spec)
+# Registered so worker processes can unpickle the parsing function.
+sys.modules["csv_converter"] = csv_converter
+spec.loader.exec_module(csv_converter)
+
+
+def write_savings_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        f.write("Savings,,,,,\nskip1,skip2,date,amount,category,notes\n")
+        f.writelines(rows)
+
+
+def convert_sequential(path):
+    converter = csv_converter.SavingsConverter()
+    with open(path, newline="") as f:
+        converter.convert(f)
+    return converter.get_payload()
+
+
+def convert_parallel(path, jobs):
+    converter = csv_converter.SavingsConverter()
+    converter.convert_mmap(str(path), jobs=jobs)
+    return converter.get_payload()
+
+
+@pytest.mark.parametrize("jobs", [3, 5, 13])
+def test_convert_mmap_handles_literal_and_quoted_quotes(tmp_path, jobs):
+    path = tmp_path / "savings.csv"
+    rows = []
+    for i in range(800):
+        if i % 3 == 0:
+            notes = '12" pipe'
+        elif i % 3 == 1:
+            notes = '"multi\nline ""quoted"" note"'
+        else:
+            notes = "plain"
+        rows.append(f',,2024-01-{i % 28 + 1:02d},"{i},000.50",Cat {i % 7},{notes}\n')
+    write_savings_csv(path, rows)
+
+    assert convert_parallel(path, jobs) == convert_sequential(path)
+
+
+def test_split_csv_ranges_ends_on_record_boundaries(tmp_path):
+    path = tmp_path / "savings.csv"
+    write_savings_csv(
+        path, [',,2024-01-01,1.00,Cat,"a\n""b"",\nc"\n', ',,2024-01-02,2.00,Cat,5" x\n'] * 50
+    )
+
+    ranges = csv_converter.split_csv_ranges(
+        str(path), 7, skip_records=csv_converter.SAVINGS_HEADER_ROWS
+    )
+
+    data = path.read_bytes()
+    assert ranges[-1][1] == len(data)
+    for start, _ in ranges:
+        assert data[start:].startswith(b",,2024-01-0")